@@ -7,11 +7,18 @@ with sensible defaults for all configuration values.
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
+
+try:  # optional — faster parsing straight from bytes
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +44,7 @@ class ExporterSettings:
     wrap_code_blocks: bool = True
     max_filename_length: int = 50
     smart_titles: bool = True
+    title_cache: bool = True
 
 
 @dataclass
@@ -62,24 +70,46 @@ class AppConfig:
         return Path.home() / "Downloads"
 
 
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using ``orjson`` on the raw bytes when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
 def load_config(config_path: Optional[Path] = None) -> AppConfig:
     """
     Load configuration from JSON file with fallback defaults.
 
+    The parsed result is cached per resolved path, so repeated calls
+    (one per exported file in batch mode) don't re-read config.json.
+    Each caller gets its own copy, so mutating it never leaks into later
+    ``load_config()`` calls.  Call ``clear_config_cache()`` to force a reload.
+
     Args:
         config_path: Optional path to config file. Uses default if None.
 
     Returns:
         Populated AppConfig dataclass.
     """
-    path = config_path or CONFIG_PATH
+    path = Path(config_path or CONFIG_PATH).resolve()
+    return copy.deepcopy(_load_config_cached(path))
+
+
+def clear_config_cache() -> None:
+    """Drop cached configs so the next ``load_config()`` re-reads disk."""
+    _load_config_cached.cache_clear()
+
 
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: Path) -> AppConfig:
+    """Read and parse *path* into an AppConfig (memoised by ``load_config``)."""
     if not path.exists():
         logger.warning("Config file not found at %s — using defaults.", path)
         return AppConfig()
 
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = _read_json(path)
         settings_raw = raw.get("settings", {})
         settings = ExporterSettings(
             strip_buttons=settings_raw.get("strip_buttons", True),
@@ -89,6 +119,7 @@ def load_config(config_path: Optional[Path] = None) -> AppConfig:
             wrap_code_blocks=settings_raw.get("wrap_code_blocks", True),
             max_filename_length=settings_raw.get("max_filename_length", 50),
             smart_titles=settings_raw.get("smart_titles", True),
+            title_cache=settings_raw.get("title_cache", True),
         )
         ai_raw = raw.get("ai", {})
         ai = AISettings(
@@ -110,6 +141,6 @@ def load_config(config_path: Optional[Path] = None) -> AppConfig:
         )
         logger.info("Config loaded from %s", path)
         return config
-    except (json.JSONDecodeError, KeyError) as exc:
+    except (json.JSONDecodeError, KeyError) as exc:  # orjson's error subclasses it
         logger.error("Failed to parse config: %s — using defaults.", exc)
         return AppConfig()
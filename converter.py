@@ -10,18 +10,24 @@ Handles HTML → Markdown conversion with:
 
 from __future__ import annotations
 
+import copy
 import datetime
+import functools
+import html
 import logging
+import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Tuple
-
-from bs4 import BeautifulSoup, NavigableString, Tag
-from markdownify import markdownify as md
+from typing import TYPE_CHECKING, List, Optional, TextIO, Tuple
 
 from config_loader import AppConfig, load_config
 
+# bs4 / markdownify are imported lazily inside the functions that need
+# them, so importing this module (e.g. just for save_to_file) stays cheap.
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
+
 logger = logging.getLogger(__name__)
 
 # ──────────────────────────────────────────────
@@ -33,6 +39,42 @@ _PLATFORM_NAMES: list[str] = [
     "Claude", "Copilot", "Perplexity", "DeepSeek",
 ]
 
+# Platform-name patterns, compiled once at import instead of per export.
+_PLATFORM_ALT = "|".join(re.escape(n) for n in _PLATFORM_NAMES)
+
+# Text node that is nothing but a platform name (any of them — one tree walk)
+_PLATFORM_STANDALONE_RE = re.compile(rf"^\s*(?:{_PLATFORM_ALT})\s*$", re.IGNORECASE)
+
+# Lower-cased text of an element that is pure branding ("gemini", "✨ gemini")
+_PLATFORM_BRANDING_TEXTS: frozenset[str] = frozenset(
+    {n.lower() for n in _PLATFORM_NAMES} | {f"✨ {n.lower()}" for n in _PLATFORM_NAMES}
+)
+_BRANDING_MAX_LEN = max(map(len, _PLATFORM_BRANDING_TEXTS))
+
+# Title suffix / prefix:  "My Chat - Google Gemini" / "Gemini | My Chat".
+# One alternation each; repeated groups also strip stacked branding
+# ("My Chat - Claude - Gemini").
+_PLATFORM_SUFFIX_RE = re.compile(rf"(?i)(?:\s*[-–—|:]\s*(?:{_PLATFORM_ALT}))+\s*$")
+_PLATFORM_PREFIX_RE = re.compile(rf"(?i)^(?:(?:{_PLATFORM_ALT})\s*[-–—|:]\s*)+")
+
+# "Conversation with <AI>" title prefix
+_CONVERSATION_PREFIX_RE = re.compile(r"(?i)^conversation\s+with\s+")
+
+# Full-page markdown headings to drop, in one pass: headings that are just
+# a platform name, and "Conversation with <AI>" headings.
+_POSTPROCESS_HEADING_RE = re.compile(
+    rf"^#+\s*(?:(?:{_PLATFORM_ALT})\s*"
+    r"|(?i:Conversation\s+with\s+\S+.*))$",
+    re.MULTILINE,
+)
+# Standalone "Conversation with <AI>" lines (applied after the headings)
+_CONVERSATION_LINE_RE = re.compile(
+    r"^Conversation\s+with\s+\S+.*$", re.MULTILINE | re.IGNORECASE
+)
+
+# Runs of 4+ newlines collapsed during markdown post-processing
+_EXCESS_BLANK_RE = re.compile(r"\n{4,}")
+
 # ──────────────────────────────────────────────
 #  Language Detection Maps
 # ──────────────────────────────────────────────
@@ -81,6 +123,35 @@ _CODE_BLOCK_TAG_MAP: dict[str, str] = {
     "```dart": "dart",
 }
 
+# Info string of every code fence ("```python" → "python").  Consuming the
+# whole backtick run also handles longer fences ("````js" → "js").
+_FENCE_INFO_RE = re.compile(r"```+([\w+#]*)")
+
+
+# ──────────────────────────────────────────────
+#  Parse Strainers
+# ──────────────────────────────────────────────
+
+# Only the page body (and bare content containers, for fragment-style
+# exports without a <body>) are parsed — <head>, its scripts and styles
+# are skipped entirely.
+_CONTENT_TAGS: tuple[str, ...] = ("body", "main", "article", "section", "div", "li")
+
+# Full-page export also needs <meta> for chat-title extraction (the
+# <title> text is scraped from the raw bytes) and the Gemini web
+# components used to locate the main content.
+_FULL_PAGE_TAGS: tuple[str, ...] = _CONTENT_TAGS + (
+    "meta", "bard-sidenav-content", "chat-window-content",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _strainer(tags: tuple[str, ...]) -> SoupStrainer:
+    """Build (once) a SoupStrainer keeping only *tags* at the top level."""
+    from bs4 import SoupStrainer
+
+    return SoupStrainer(list(tags))
+
 
 # ──────────────────────────────────────────────
 #  Result Data Model
@@ -101,9 +172,58 @@ class ExtractionResult:
 #  Internal Helpers
 # ──────────────────────────────────────────────
 
-def _load_html(filepath: Path) -> str:
-    """Read an HTML file with UTF-8 encoding."""
-    return filepath.read_text(encoding="utf-8")
+def _load_html(filepath: Path) -> bytes:
+    """
+    Read an HTML file as raw bytes.
+
+    Decoding is left to the parser: lxml decodes in C straight from the
+    bytes (honouring ``<meta charset>``), so no intermediate ``str``
+    copy of the whole document is built.
+    """
+    return filepath.read_bytes()
+
+
+def _parse_html(
+    markup: str | bytes, parse_only: Optional[SoupStrainer] = None
+) -> BeautifulSoup:
+    """
+    Build a BeautifulSoup tree, preferring the C-based ``lxml`` parser.
+
+    Falls back to the stdlib ``html.parser`` when lxml is not installed.
+
+    Args:
+        markup: Raw HTML bytes or text.
+        parse_only: Optional strainer restricting which top-level
+            elements are kept in the tree.
+    """
+    from bs4 import BeautifulSoup, FeatureNotFound
+
+    try:
+        return BeautifulSoup(markup, "lxml", parse_only=parse_only)
+    except FeatureNotFound:
+        logger.debug("lxml not installed — falling back to html.parser")
+        return BeautifulSoup(markup, "html.parser", parse_only=parse_only)
+
+
+@functools.lru_cache(maxsize=2)
+def _parse_content(path: Path, mtime_ns: int, size: int) -> BeautifulSoup:
+    """
+    Parse *path* with the content strainer, memoised per file version.
+
+    Interactive mode searches the same export for phrase after phrase;
+    keying on ``(mtime_ns, size)`` re-parses only when the file changes.
+    The returned tree is shared — callers must not modify it.
+    """
+    return _parse_html(_load_html(path), parse_only=_strainer(_CONTENT_TAGS))
+
+
+@functools.lru_cache(maxsize=256)
+def _fence_languages(info: str) -> frozenset[str]:
+    """Languages whose ``_CODE_BLOCK_TAG_MAP`` marker matches a fence info string."""
+    return frozenset(
+        lang for marker, lang in _CODE_BLOCK_TAG_MAP.items()
+        if info.startswith(marker[3:])
+    )
 
 
 def _auto_detect_tags(content: str) -> List[str]:
@@ -112,12 +232,13 @@ def _auto_detect_tags(content: str) -> List[str]:
     Uses code-block markers AND syntax heuristics.
     """
     tags: set[str] = {"ai-chat"}
+    # One lower-cased copy lets every check below use CPython's C
+    # substring search, which is far faster than re.IGNORECASE scans.
     lower = content.lower()
 
-    # Code-block markers
-    for marker, lang in _CODE_BLOCK_TAG_MAP.items():
-        if marker in lower:
-            tags.add(lang)
+    # Code-block markers — one scan collects each distinct fence info string
+    for info in set(_FENCE_INFO_RE.findall(lower)):
+        tags.update(_fence_languages(info))
 
     # Syntax heuristics
     if "def " in lower and ":" in lower:
@@ -126,7 +247,7 @@ def _auto_detect_tags(content: str) -> List[str]:
         tags.add("cpp")
     if "console.log" in lower:
         tags.add("javascript")
-    if "fmt.println" in lower or "func " in lower and "go" not in tags:
+    if "fmt.println" in lower or "func " in lower:
         tags.add("go")
     if "fn " in lower and "let mut" in lower:
         tags.add("rust")
@@ -136,12 +257,29 @@ def _auto_detect_tags(content: str) -> List[str]:
     return sorted(tags)
 
 
+_FRONTMATTER_TMPL = (
+    "---\n"
+    'title: "{title}"\n'
+    "date: {date}\n"
+    "tags: [{tags}]\n"
+    'source: "{url}"\n'
+    "---\n\n"
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _format_date(ordinal: int, date_format: str) -> str:
+    """strftime a day (given as ordinal), memoised per (day, format)."""
+    return datetime.date.fromordinal(ordinal).strftime(date_format)
+
+
 def generate_frontmatter(
     title: str,
     content: str,
     *,
     url: str = "Local File",
     date_format: str = "%Y-%m-%d",
+    tags: Optional[List[str]] = None,
 ) -> str:
     """
     Build YAML frontmatter block for Obsidian/Notion compatibility.
@@ -151,29 +289,79 @@ def generate_frontmatter(
         content: Markdown body (used for auto-tagging).
         url: Source URL or label.
         date_format: strftime format string.
+        tags: Tags already computed for *content* (e.g.
+            ``ExtractionResult.detected_languages``); skips re-scanning it.
 
     Returns:
         YAML frontmatter string terminated by a blank line.
     """
-    date_str = datetime.date.today().strftime(date_format)
-    tags = _auto_detect_tags(content)
-    tag_str = ", ".join(tags)
-
-    return (
-        f"---\n"
-        f'title: "{title}"\n'
-        f"date: {date_str}\n"
-        f"tags: [{tag_str}]\n"
-        f'source: "{url}"\n'
-        f"---\n\n"
-    )
+    if tags is None:
+        tags = _auto_detect_tags(content)
+
+    return _FRONTMATTER_TMPL.format_map({
+        "title": title,
+        "date": _format_date(datetime.date.today().toordinal(), date_format),
+        "tags": ", ".join(tags),
+        "url": url,
+    })
 
 
 # ──────────────────────────────────────────────
 #  Language Detection (for <code> elements)
 # ──────────────────────────────────────────────
 
-def get_code_language(el: Tag) -> str:
+# Tags whose text may label the code block that follows them
+_PROXIMITY_TAGS = frozenset({"p", "div", "h3", "h4", "h5", "li", "span"})
+
+# Syntax-analysis patterns, compiled once rather than per code block
+# (the C parameter list allows one level of nested parens for function-
+# pointer params but never scans past an unmatched one, which keeps the
+# search linear even on header-style code full of prototypes)
+_C_FUNC_RE = re.compile(
+    r"\b(?:int|void|double|float|bool|char)\s+\w+\s*"
+    r"\((?:[^()]|\([^()]*\))*\)\s*\{"
+)
+_SQL_RE = re.compile(r"\bSELECT\b.*\bFROM\b", re.IGNORECASE | re.DOTALL)
+_HTML_TAG_RE = re.compile(r"<\/?[a-z]+[^>]*>", re.IGNORECASE)
+
+
+def _preceding_blocks(el: Tag, *, limit: int) -> List[Tag]:
+    """
+    Return up to *limit* ``_PROXIMITY_TAGS`` elements before *el*, nearest first.
+
+    Same result as ``el.find_all_previous(list(_PROXIMITY_TAGS), limit=limit)``
+    but walks ``previous_elements`` directly, skipping BeautifulSoup's
+    generic matcher for every text node on the way.
+    """
+    found: List[Tag] = []
+    for node in el.previous_elements:
+        if node.name in _PROXIMITY_TAGS:  # text nodes have name None
+            found.append(node)
+            if len(found) == limit:
+                break
+    return found
+
+
+def _proximity_language(block: Tag) -> str:
+    """Language named in the text blocks just before *block*, or ``""``."""
+    for prev in _preceding_blocks(block, limit=4):
+        text = prev.get_text(strip=True)
+        if len(text) > 120:
+            text = text[-60:]
+        text = text.lower()  # only the part that is searched
+
+        for label, lang in _LABEL_MAP.items():
+            if label in text:
+                # Guard "java" from matching "javascript"
+                if label == "java" and "script" in text:
+                    continue
+                return lang
+    return ""
+
+
+def get_code_language(
+    el: Tag, *, label_cache: Optional[dict[int, str]] = None
+) -> str:
     """
     Detect the programming language of a ``<code>``/``<pre>`` element.
 
@@ -184,6 +372,10 @@ def get_code_language(el: Tag) -> str:
 
     Args:
         el: A BeautifulSoup Tag representing a code element.
+        label_cache: Optional dict memoising the proximity result per
+            parent element.  Code blocks sharing a container share the
+            same preceding blocks, and one of those is often the whole
+            message, so a conversion passes one dict for all its blocks.
 
     Returns:
         Canonical language string, or ``""`` if undetermined.
@@ -196,21 +388,15 @@ def get_code_language(el: Tag) -> str:
             return cls.split("-", 1)[1]
 
     # --- 2. Proximity Search ---
-    search_limit = 4
-    preceding = el.parent.find_all_previous(
-        ["p", "div", "h3", "h4", "h5", "li", "span"], limit=search_limit
-    )
-    for prev in preceding:
-        text = prev.get_text(strip=True).lower()
-        if len(text) > 120:
-            text = text[-60:]
-
-        for label, lang in _LABEL_MAP.items():
-            if label in text:
-                # Guard "java" from matching "javascript"
-                if label == "java" and "script" in text:
-                    continue
-                return lang
+    if label_cache is None:
+        label = _proximity_language(el.parent)
+    else:
+        key = id(el.parent)
+        label = label_cache.get(key)
+        if label is None:
+            label = label_cache[key] = _proximity_language(el.parent)
+    if label:
+        return label
 
     # --- 3. Syntax Analysis ---
     code = el.get_text()
@@ -220,11 +406,7 @@ def get_code_language(el: Tag) -> str:
         return "cpp"
     if "cout" in code and "<<" in code:
         return "cpp"
-    if re.search(
-        r"\b(int|void|double|float|bool|char)\s+\w+\s*\(.*?\)\s*\{",
-        code,
-        re.DOTALL,
-    ):
+    if _C_FUNC_RE.search(code):
         return "cpp"
 
     # Python
@@ -248,20 +430,49 @@ def get_code_language(el: Tag) -> str:
         return "javascript"
 
     # SQL
-    if re.search(r"\bSELECT\b.*\bFROM\b", code, re.IGNORECASE | re.DOTALL):
+    if _SQL_RE.search(code):
         return "sql"
 
     # HTML
-    if re.search(r"<\/?[a-z]+[^>]*>", code, re.IGNORECASE):
+    if _HTML_TAG_RE.search(code):
         return "html"
 
     return ""
 
 
+def _to_markdown(node: Tag | BeautifulSoup, heading_style: str) -> str:
+    """
+    Convert an already-parsed subtree to Markdown.
+
+    Hands the tree straight to markdownify instead of serialising it
+    with ``str()`` only for markdownify to parse it again.  The node is
+    detached and re-rooted in an empty document first, which is exactly
+    the tree that re-parsing used to produce — so language proximity
+    search still only sees text *inside* the converted subtree.
+    """
+    from bs4 import BeautifulSoup
+    from markdownify import MarkdownConverter
+
+    if not isinstance(node, BeautifulSoup):
+        doc = BeautifulSoup("", "html.parser")
+        doc.append(node.extract())
+        node = doc
+
+    labels: dict[int, str] = {}  # proximity label per code-block parent
+    converter = MarkdownConverter(
+        heading_style=heading_style,
+        code_language_callback=lambda el: get_code_language(el, label_cache=labels),
+    )
+    return converter.convert_soup(node)
+
+
 # ──────────────────────────────────────────────
 #  Chat Title Extraction
 # ──────────────────────────────────────────────
 
+# <title> element in raw HTML bytes (scraped before the full parse)
+_TITLE_BYTES_RE = re.compile(rb"<title[^>]*>(.*?)</title\s*>", re.IGNORECASE | re.DOTALL)
+
 # Platform names that should be stripped from raw titles
 _PLATFORM_NAME_SET = {n.lower() for n in _PLATFORM_NAMES}
 
@@ -286,15 +497,10 @@ def _clean_raw_title(raw: str) -> Optional[str]:
     """Strip platform names, separators, suffixes and prefixes from a raw title string."""
     cleaned = raw.strip()
     # Remove "Conversation with …" prefix
-    cleaned = re.sub(r"(?i)^conversation\s+with\s+", "", cleaned)
+    cleaned = _CONVERSATION_PREFIX_RE.sub("", cleaned)
     # Remove platform names as suffix:  "My Chat - Google Gemini"
-    for name in _PLATFORM_NAMES:
-        cleaned = re.sub(
-            rf"(?i)\s*[-–—|:]\s*{re.escape(name)}\s*$", "", cleaned
-        )
-        cleaned = re.sub(
-            rf"(?i)^{re.escape(name)}\s*[-–—|:]\s*", "", cleaned
-        )
+    cleaned = _PLATFORM_SUFFIX_RE.sub("", cleaned)
+    cleaned = _PLATFORM_PREFIX_RE.sub("", cleaned)
     # Remove sidebar metadata suffixes ("Pinned Chat", "Today", etc.)
     cleaned = _SIDEBAR_SUFFIX_RE.sub("", cleaned)
     cleaned = cleaned.strip(" -–—|:")
@@ -305,7 +511,28 @@ def _clean_raw_title(raw: str) -> Optional[str]:
     return cleaned
 
 
-def _extract_chat_title(soup: BeautifulSoup) -> Optional[str]:
+def _scrape_page_title(raw_html: bytes, encoding: Optional[str] = None) -> str:
+    """
+    Pull the ``<title>`` text straight from the raw bytes.
+
+    Lets ``extract_full_page`` skip ``<title>`` in its parse strainer.
+    *encoding* is the document encoding detected by the parser
+    (``soup.original_encoding``); UTF-8 is assumed when it is unknown.
+    Returns ``""`` when the page has no title.
+    """
+    match = _TITLE_BYTES_RE.search(raw_html)
+    if not match:
+        return ""
+    try:
+        text = match.group(1).decode(encoding or "utf-8", "replace")
+    except LookupError:  # codec name Python doesn't know
+        text = match.group(1).decode("utf-8", "replace")
+    return html.unescape(text).strip()
+
+
+def _extract_chat_title(
+    soup: BeautifulSoup, *, page_title: Optional[str] = None
+) -> Optional[str]:
     """
     Extract the conversation title from the DOM **before** cleanup runs.
 
@@ -315,6 +542,11 @@ def _extract_chat_title(soup: BeautifulSoup) -> Optional[str]:
       3. ``<title>`` tag content (with platform-name stripping)
       4. First ``<h1>`` that is NOT a platform name or UI label
       5. ``og:title`` / ``twitter:title`` meta tags
+
+    Args:
+        soup: Parsed page.
+        page_title: ``<title>`` text already scraped from the raw HTML;
+            if None, the ``<title>`` tag is looked up in *soup*.
     """
     # ── Strategy 1: Active sidebar chat item ───────
     # Gemini (and others) highlight the current chat in the sidebar.
@@ -348,15 +580,22 @@ def _extract_chat_title(soup: BeautifulSoup) -> Optional[str]:
             if result:
                 logger.debug("Title from active sidebar item (class): %s", result)
                 return result
-    # Also scan role="complementary" / role="navigation" containers
-    for role in ("complementary", "navigation"):
-        for container in soup.find_all(attrs={"role": role}, limit=3):
-            for item in container.find_all(class_=_active_class_re, limit=5):
-                text = item.get_text(" ", strip=True)
-                result = _clean_raw_title(text)
-                if result:
-                    logger.debug("Title from active sidebar item (role): %s", result)
-                    return result
+    # Also scan role="complementary" / role="navigation" containers:
+    # one walk collects up to 3 of each, complementary checked first
+    role_containers: dict[str, list] = {role: [] for role in _SIDEBAR_ROLES}
+    for el in soup.descendants:
+        bucket = role_containers.get(getattr(el, "attrs", {}).get("role"))
+        if bucket is not None and len(bucket) < 3:
+            bucket.append(el)
+            if all(len(b) == 3 for b in role_containers.values()):
+                break
+    for container in (*role_containers["complementary"], *role_containers["navigation"]):
+        for item in container.find_all(class_=_active_class_re, limit=5):
+            text = item.get_text(" ", strip=True)
+            result = _clean_raw_title(text)
+            if result:
+                logger.debug("Title from active sidebar item (role): %s", result)
+                return result
 
     # ── Strategy 2: First user message ─────────────
     # Most platforms mark user turns with data attributes or known classes.
@@ -376,9 +615,11 @@ def _extract_chat_title(soup: BeautifulSoup) -> Optional[str]:
                 return text
 
     # ── Strategy 3: <title> tag ────────────────────
-    title_tag = soup.find("title")
-    if title_tag:
-        result = _clean_raw_title(title_tag.get_text(strip=True))
+    if page_title is None:
+        title_tag = soup.find("title")
+        page_title = title_tag.get_text(strip=True) if title_tag else ""
+    if page_title:
+        result = _clean_raw_title(page_title)
         if result:
             return result
 
@@ -406,6 +647,17 @@ def _extract_chat_title(soup: BeautifulSoup) -> Optional[str]:
 #  Platform Artifact Cleanup
 # ──────────────────────────────────────────────
 
+# Tags removed outright by a full-page export, in a single tree walk:
+# basic non-content tags and <aside> sidebars.  <title> and input
+# fields are removed later by _strip_platform_artifacts — their text
+# still counts towards the sidebar size guard.
+_FULL_PAGE_STRIP_TAGS: list[str] = [
+    "button", "svg", "nav", "footer", "script", "style", "header", "aside",
+]
+
+# Input fields dropped with the popups, after the sidebar pass
+_INPUT_TAGS = frozenset({"textarea", "input"})
+
 # Maximum text-length for an element to be treated as a sidebar.
 # Containers with more text are likely main-content wrappers that
 # happen to carry sidebar-like class names (e.g. Gemini's
@@ -428,6 +680,18 @@ _SIDEBAR_ARIA_RE = re.compile(
     re.IGNORECASE,
 )
 
+# ARIA roles of sidebar-like landmarks (subject to _SIDEBAR_MAX_TEXT)
+_SIDEBAR_ROLES = frozenset({"complementary", "navigation"})
+
+# ARIA roles of popups that are always removed
+_OVERLAY_ROLES = frozenset({"dialog", "tooltip", "alertdialog"})
+
+# Elements removed when their whole text is a platform name
+_BRANDING_PARENT_TAGS = frozenset({
+    "h1", "h2", "h3", "h4", "h5", "h6",
+    "span", "div", "a", "p", "label",
+})
+
 # Regex for overlay / popup class names
 _OVERLAY_CLASS_RE = re.compile(
     r"tooltip|popover|modal|overlay|backdrop|snackbar",
@@ -443,6 +707,13 @@ _USER_MSG_CLASS_RE = re.compile(
 )
 
 
+def _in_tree(el: Tag, root: BeautifulSoup) -> bool:
+    """True if *el* is still attached under *root* (not in a removed subtree)."""
+    while el.parent is not None:
+        el = el.parent
+    return el is root
+
+
 def _strip_platform_artifacts(soup: BeautifulSoup) -> None:
     """
     Remove platform-specific UI chrome from the DOM before Markdown
@@ -453,60 +724,75 @@ def _strip_platform_artifacts(soup: BeautifulSoup) -> None:
       • Platform branding headers ("Google Gemini", "ChatGPT", …)
       • Input areas, tooltips, modals
       • Common UI detritus that leaks into exports
-    """
-    # ── 1. Sidebar & navigation panels ──────────────
-    for tag in soup(["aside"]):
-        tag.decompose()
-
-    for role in ("complementary", "navigation"):
-        for el in soup.find_all(attrs={"role": role}):
-            if len(el.get_text(strip=True)) > _SIDEBAR_MAX_TEXT:
-                continue
-            el.decompose()
 
-    for el in soup.find_all(class_=_SIDEBAR_CLASS_RE):
-        if len(el.get_text(strip=True)) > _SIDEBAR_MAX_TEXT:
-            continue
-        el.decompose()
-
-    for el in soup.find_all(attrs={"aria-label": _SIDEBAR_ARIA_RE}):
-        if len(el.get_text(strip=True)) > _SIDEBAR_MAX_TEXT:
-            continue
-        el.decompose()
+    ``<aside>`` is in ``_FULL_PAGE_STRIP_TAGS`` and is removed in the
+    same walk as the basic tag cleanup.
+    """
+    # ── 1. Classify role / class / aria-label chrome ──
+    #   A single walk sorts every element into the candidate lists,
+    #   instead of one find_all() per role, class regex and aria-label
+    #   regex.  Removal then replays the original pass order: the
+    #   sidebar size guard must measure each candidate after the
+    #   earlier sidebar removals (a nested nav panel is gone before its
+    #   enclosing sidebar is measured), but while popups and input
+    #   areas are still in place.
+    complementary: List[Tag] = []
+    navigation: List[Tag] = []
+    sidebar_class: List[Tag] = []
+    sidebar_aria: List[Tag] = []
+    titles: List[Tag] = []
+    popups: List[Tag] = []  # overlays, contenteditable areas and input fields
+    for el in soup.find_all(True):
+        role = el.get("role")
+        classes = " ".join(el.get("class") or ())
+        if role == "complementary":
+            complementary.append(el)
+        elif role == "navigation":
+            navigation.append(el)
+        if _SIDEBAR_CLASS_RE.search(classes):
+            sidebar_class.append(el)
+        if _SIDEBAR_ARIA_RE.search(el.get("aria-label") or ""):
+            sidebar_aria.append(el)
+        if el.name == "title":
+            titles.append(el)
+        elif (
+            el.name in _INPUT_TAGS
+            or role in _OVERLAY_ROLES
+            or _OVERLAY_CLASS_RE.search(classes)
+            or el.get("contenteditable") == "true"
+        ):
+            popups.append(el)
+
+    # Sidebars / drawers — guarded against content-sized containers.
+    # A candidate inside an already removed panel is skipped.
+    for el in (*complementary, *navigation, *sidebar_class, *sidebar_aria):
+        if _in_tree(el, soup) and len(el.get_text(strip=True)) <= _SIDEBAR_MAX_TEXT:
+            el.extract()
 
     # ── 2. Platform branding ───────────────────────
     # <title> tags bleed into markdown as text
-    for t in soup(["title"]):
-        t.decompose()
+    for el in titles:
+        el.extract()
 
     # Standalone text nodes that are JUST a platform name
-    for name in _PLATFORM_NAMES:
-        pattern = re.compile(rf"^\s*{re.escape(name)}\s*$", re.IGNORECASE)
-        for text_node in soup.find_all(string=pattern):
-            parent = text_node.parent
-            if parent is None:
-                continue
-            if parent.name in {
-                "h1", "h2", "h3", "h4", "h5", "h6",
-                "span", "div", "a", "p", "label",
-            }:
-                parent_text = parent.get_text(strip=True).lower()
-                if parent_text in (name.lower(), f"✨ {name.lower()}"):
-                    parent.decompose()
-
-    # ── 3. Input / prompt areas ────────────────────
-    for el in soup.find_all(attrs={"contenteditable": "true"}):
-        el.decompose()
-    for el in soup.find_all(["textarea", "input"]):
-        el.decompose()
-
-    # ── 4. Modals / tooltips / overlays ────────────
-    for role in ("dialog", "tooltip", "alertdialog"):
-        for el in soup.find_all(attrs={"role": role}):
-            el.decompose()
-
-    for el in soup.find_all(class_=_OVERLAY_CLASS_RE):
-        el.decompose()
+    checked: set[int] = set()  # parents whose text was already compared
+    for text_node in soup.find_all(string=_PLATFORM_STANDALONE_RE):
+        parent = text_node.parent
+        if parent is None or id(parent) in checked:
+            continue
+        checked.add(id(parent))
+        if parent.name in _BRANDING_PARENT_TAGS:
+            parent_text = parent.get_text(strip=True)
+            # lower() never shortens text, so longer text can't be branding
+            if (
+                len(parent_text) <= _BRANDING_MAX_LEN
+                and parent_text.lower() in _PLATFORM_BRANDING_TEXTS
+            ):
+                parent.decompose()
+
+    # ── 3. Input / prompt areas, modals / tooltips / overlays ──
+    for el in popups:
+        el.extract()
 
     logger.debug("Stripped platform artifacts from DOM")
 
@@ -555,6 +841,23 @@ def _simplify_user_messages(soup: BeautifulSoup) -> None:
 #  Core Extraction Logic
 # ──────────────────────────────────────────────
 
+def _find_text(soup: BeautifulSoup, phrase: str) -> Optional[NavigableString]:
+    """
+    Return the first text node containing *phrase* (case-insensitive).
+
+    Equivalent to ``soup.find(string=lambda t: phrase.lower() in t.lower())``
+    but lowers the needle once and walks ``descendants`` directly instead
+    of routing every node through BeautifulSoup's generic matcher.
+    """
+    from bs4 import NavigableString
+
+    needle = phrase.lower()
+    for node in soup.descendants:
+        if isinstance(node, NavigableString) and node and needle in node.lower():
+            return node
+    return None
+
+
 def extract_response(
     file_path: Path | str,
     search_phrase: str,
@@ -575,21 +878,17 @@ def extract_response(
     cfg = config or load_config()
     path = Path(file_path)
 
-    if not path.exists():
-        return ExtractionResult(success=False, message="File not found.")
-
     try:
-        raw_html = _load_html(path)
-    except UnicodeDecodeError:
-        logger.error("Encoding error reading %s", path)
-        return ExtractionResult(success=False, message="Failed to read file — encoding issue.")
-
-    soup = BeautifulSoup(raw_html, "html.parser")
+        stat = path.stat()
+        soup = _parse_content(path, stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        return ExtractionResult(success=False, message="File not found.")
+    except OSError as exc:
+        logger.error("Could not read %s: %s", path, exc)
+        return ExtractionResult(success=False, message="Failed to read file.")
 
     # 1. Locate user message containing the search phrase
-    user_node = soup.find(
-        string=lambda text: text and search_phrase.lower() in text.lower()
-    )
+    user_node = _find_text(soup, search_phrase)
     if not user_node:
         logger.warning("Phrase '%s' not found in %s", search_phrase, path.name)
         return ExtractionResult(success=False, message="Phrase not found in the document.")
@@ -602,10 +901,11 @@ def extract_response(
     if container is None:
         return ExtractionResult(success=False, message="Could not determine message container.")
 
-    # 3. Find the AI response block
+    # 3. Find the AI response block — walked lazily, since find_all_next()
+    #    would collect every later <div> in the document before the break
     ai_node: Optional[Tag] = None
-    for sibling in container.find_all_next("div"):
-        if sibling == container:
+    for sibling in container.next_elements:
+        if sibling.name != "div" or sibling == container:
             continue
         if len(sibling.get_text(strip=True)) > 20:
             ai_node = sibling
@@ -617,23 +917,24 @@ def extract_response(
             message="Found question, but couldn't isolate the AI answer.",
         )
 
+    # The parsed tree is cached across calls — work on a copy of the answer
+    ai_node = copy.copy(ai_node)
+
     # 4. Clean up non-content elements
     removable = ["button", "svg", "img", "nav", "footer", "script", "style"]
     if cfg.settings.strip_buttons:
         removable.extend(["a[class*='copy']", "div[class*='toolbar']"])
+    #    extract() just unlinks; decompose() would also tear down each
+    #    subtree, including matches nested in ones already removed
     for tag in ai_node(removable[:6]):  # BeautifulSoup tags
-        tag.decompose()
+        tag.extract()
 
     # 5. Convert to Markdown
     heading_style = cfg.settings.heading_style if cfg else "ATX"
-    markdown_text: str = md(
-        str(ai_node),
-        heading_style=heading_style,
-        code_language_callback=get_code_language,
-    )
+    markdown_text: str = _to_markdown(ai_node, heading_style)
 
     # 6. Post-process — remove excessive blank lines
-    markdown_text = re.sub(r"\n{4,}", "\n\n\n", markdown_text)
+    markdown_text = _EXCESS_BLANK_RE.sub("\n\n\n", markdown_text)
 
     detected = _auto_detect_tags(markdown_text)
     detected.discard("ai-chat") if isinstance(detected, set) else None
@@ -680,27 +981,31 @@ def extract_full_page(
     cfg = config or load_config()
     path = Path(file_path)
 
-    if not path.exists():
-        return ExtractionResult(success=False, message="File not found.")
-
     try:
         raw_html = _load_html(path)
-    except UnicodeDecodeError:
-        logger.error("Encoding error reading %s", path)
-        return ExtractionResult(success=False, message="Failed to read file — encoding issue.")
+    except FileNotFoundError:
+        return ExtractionResult(success=False, message="File not found.")
+    except OSError as exc:
+        logger.error("Could not read %s: %s", path, exc)
+        return ExtractionResult(success=False, message="Failed to read file.")
 
-    soup = BeautifulSoup(raw_html, "html.parser")
+    soup = _parse_html(raw_html, parse_only=_strainer(_FULL_PAGE_TAGS))
 
     # ── Phase 0: Extract conversation title before cleanup ──
-    chat_title: Optional[str] = _extract_chat_title(soup)
+    chat_title: Optional[str] = _extract_chat_title(
+        soup, page_title=_scrape_page_title(raw_html, soup.original_encoding)
+    )
 
     # ── Phase 1: Basic tag cleanup ─────────────────
-    for tag in soup(["button", "svg", "nav", "footer", "script", "style", "header"]):
-        tag.decompose()
+    #   Tag-name based chrome (incl. <aside> sidebars) goes in one
+    #   walk over the tree, unlinked with extract() rather than torn
+    #   down node by node with decompose().
+    for tag in soup(_FULL_PAGE_STRIP_TAGS):
+        tag.extract()
 
     if cfg.settings.strip_buttons:
         for tag in soup.select("div[class*='toolbar'], a[class*='copy']"):
-            tag.decompose()
+            tag.extract()
 
     # ── Phase 2: Platform-specific cleanup ─────────
     #   • Strips sidebars / drawers (old chat lists)
@@ -728,29 +1033,15 @@ def extract_full_page(
 
     # ── Phase 5: Convert to Markdown ───────────────
     heading_style = cfg.settings.heading_style
-    markdown_text: str = md(
-        str(main_content),
-        heading_style=heading_style,
-        code_language_callback=get_code_language,
-    )
+    markdown_text: str = _to_markdown(main_content, heading_style)
 
     # ── Phase 6: Post-process ──────────────────────
     # Remove remaining platform name lines that survived DOM stripping
-    for name in _PLATFORM_NAMES:
-        markdown_text = re.sub(
-            rf"^#+\s*{re.escape(name)}\s*$", "", markdown_text, flags=re.MULTILINE
-        )
-    # Remove "Conversation with <AI>" headings and standalone lines
-    markdown_text = re.sub(
-        r"^#+\s*Conversation\s+with\s+\S+.*$", "", markdown_text,
-        flags=re.MULTILINE | re.IGNORECASE,
-    )
-    markdown_text = re.sub(
-        r"^Conversation\s+with\s+\S+.*$", "", markdown_text,
-        flags=re.MULTILINE | re.IGNORECASE,
-    )
+    # and "Conversation with <AI>" headings / standalone lines
+    markdown_text = _POSTPROCESS_HEADING_RE.sub("", markdown_text)
+    markdown_text = _CONVERSATION_LINE_RE.sub("", markdown_text)
     # Collapse excessive blank lines
-    markdown_text = re.sub(r"\n{4,}", "\n\n\n", markdown_text)
+    markdown_text = _EXCESS_BLANK_RE.sub("\n\n\n", markdown_text)
     # Strip leading blank lines
     markdown_text = markdown_text.lstrip("\n")
 
@@ -778,6 +1069,26 @@ def extract_full_page(
 #  File I/O
 # ──────────────────────────────────────────────
 
+def _render_entry(
+    content: str,
+    title_for_header: str,
+    *,
+    is_new: bool,
+    cfg: AppConfig,
+    tags: Optional[List[str]],
+) -> str:
+    """Frontmatter + heading for a new file, rule separator + heading otherwise."""
+    if is_new:
+        header = generate_frontmatter(
+            title_for_header,
+            content,
+            date_format=cfg.settings.date_format,
+            tags=tags,
+        )
+        return header + f"# {title_for_header}\n\n" + content
+    return f"\n\n---\n\n# {title_for_header}\n\n" + content
+
+
 def save_to_file(
     content: str,
     filename: str,
@@ -785,12 +1096,15 @@ def save_to_file(
     *,
     mode: str = "w",
     config: Optional[AppConfig] = None,
+    tags: Optional[List[str]] = None,
 ) -> Path:
     """
     Save markdown content to the export folder.
 
-    In write mode a full YAML frontmatter is prepended;
-    in append mode a horizontal rule separator is added.
+    In write mode a full YAML frontmatter is prepended and the file is
+    replaced atomically (written beside the target, then swapped in), so
+    a reader never sees a half-written note; in append mode a horizontal
+    rule separator is added.
 
     Args:
         content: Markdown body text.
@@ -798,27 +1112,86 @@ def save_to_file(
         title_for_header: Human-readable title.
         mode: ``'w'`` for new file, ``'a'`` for append.
         config: Optional AppConfig.
+        tags: Precomputed frontmatter tags (auto-detected if None).
 
     Returns:
         Absolute path of the saved file.
     """
     cfg = config or load_config()
-    folder = Path(cfg.default_save_folder)
-    folder.mkdir(parents=True, exist_ok=True)
-    full_path = folder / filename
-
-    is_new = not full_path.exists() or mode == "w"
-
-    with full_path.open(mode, encoding="utf-8") as fh:
-        if is_new:
-            header = generate_frontmatter(
-                title_for_header,
-                content,
-                date_format=cfg.settings.date_format,
-            )
-            fh.write(header + f"# {title_for_header}\n\n" + content)
-        else:
-            fh.write(f"\n\n---\n\n# {title_for_header}\n\n" + content)
-
-    logger.info("Saved → %s (%s)", full_path, "new" if is_new else "appended")
-    return full_path
\ No newline at end of file
+    if mode != "w":
+        with MergeWriter(filename, config=cfg) as merger:
+            return merger.write(content, title_for_header, tags=tags)
+
+    full_path = Path(cfg.default_save_folder) / filename
+    text = _render_entry(content, title_for_header, is_new=True, cfg=cfg, tags=tags)
+    tmp_path = full_path.with_name(full_path.name + ".tmp")
+    try:
+        tmp_path.write_text(text, encoding="utf-8")
+    except FileNotFoundError:
+        # First save into this folder — create it and retry
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, full_path)
+
+    logger.info("Saved → %s (new)", full_path)
+    return full_path
+
+
+class MergeWriter:
+    """
+    Append many notes to one merge file through a single open handle.
+
+    Each note is formatted like ``save_to_file(mode="a")``: frontmatter
+    if the file is new, a rule separator otherwise.  The file is opened
+    on the first write, so an unused writer leaves nothing behind, and
+    flushed after every note, so each one is on disk straight away.
+
+    Usage::
+
+        with MergeWriter("Notes.md", config=cfg) as merger:
+            merger.write(markdown, title)
+    """
+
+    def __init__(self, filename: str, *, config: Optional[AppConfig] = None) -> None:
+        self.cfg = config or load_config()
+        self.filename = filename
+        self.path = Path(self.cfg.default_save_folder) / filename
+        self._fh: Optional[TextIO] = None
+        self._is_new = False
+
+    def __enter__(self) -> MergeWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def write(
+        self,
+        content: str,
+        title_for_header: str,
+        *,
+        tags: Optional[List[str]] = None,
+    ) -> Path:
+        """Append one note and return the merge file's path."""
+        if self._fh is None:
+            self._is_new = not self.path.exists()
+            try:
+                self._fh = self.path.open("a", encoding="utf-8")
+            except FileNotFoundError:
+                # First save into this folder — create it and retry
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._fh = self.path.open("a", encoding="utf-8")
+
+        self._fh.write(_render_entry(
+            content, title_for_header, is_new=self._is_new, cfg=self.cfg, tags=tags,
+        ))
+        self._fh.flush()
+        logger.info("Saved → %s (%s)", self.path, "new" if self._is_new else "appended")
+        self._is_new = False
+        return self.path
+
+    def close(self) -> None:
+        """Close the merge file (a no-op if nothing was written)."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
@@ -0,0 +1,55 @@
+"""Test extract_full_page — sidebar / chrome stripping edge cases."""
+import tempfile
+from pathlib import Path
+
+from config_loader import AppConfig
+from converter import extract_full_page
+
+
+def _export(html: str, encoding: str = "utf-8"):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "chat.html"
+        path.write_text(html, encoding=encoding)
+        result = extract_full_page(path, config=AppConfig())
+    assert result.success, f"FAIL: {result.message}"
+    return result
+
+
+# Test 1: a nested nav panel is removed before its sidebar is size-checked
+side = "sidebar chat " * 300   # ~3900 chars — under the sidebar limit
+nav = "older chat " * 180      # ~2000 chars — together over the limit
+html1 = (
+    '<html><head><title>Nested Sidebar</title></head><body>'
+    f'<div class="sidebar"><p>{side}</p><div role="navigation"><p>{nav}</p></div></div>'
+    '<div><p>Real answer content here.</p></div>'
+    '</body></html>'
+)
+md1 = _export(html1).markdown
+print(f"Test 1 (nested sidebar/nav):    {md1[:40]!r}")
+assert "sidebar chat" not in md1 and "older chat" not in md1, "FAIL: sidebar kept"
+assert "Real answer content here." in md1, "FAIL: content lost"
+
+# Test 2: input-field text still counts towards the sidebar size guard
+keep = "keep me " * 375        # 3000 chars of real content
+typed = "typed text " * 230    # ~2500 chars in a <textarea>
+html2 = (
+    '<html><head><title>Textarea</title></head><body>'
+    f'<div class="sidebar"><p>{keep}</p><textarea>{typed}</textarea></div>'
+    '<div><p>Real answer content here.</p></div>'
+    '</body></html>'
+)
+md2 = _export(html2).markdown
+print(f"Test 2 (textarea in sidebar):   {md2[:40]!r}")
+assert "keep me" in md2, "FAIL: content-sized container removed"
+assert "typed text" not in md2, "FAIL: textarea kept"
+
+# Test 3: the <title> is decoded with the page's declared charset
+html3 = (
+    '<html><head><meta charset="iso-8859-1"><title>Café Question</title></head>'
+    '<body><div><p>Real answer content here.</p></div></body></html>'
+)
+title3 = _export(html3, encoding="iso-8859-1").title
+print(f"Test 3 (iso-8859-1 title):      {title3!r}")
+assert title3 == "Café Question", f"FAIL: got {title3!r}"
+
+print("\nALL TESTS PASSED")
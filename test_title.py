@@ -77,4 +77,25 @@ t6 = _extract_chat_title(BeautifulSoup(html6, "html.parser"))
 print(f"Test 6 (user msg fallback):     {t6!r}")
 assert t6 == "How do I sort in C++", f"FAIL: {t6}"
 
+# Test 7: stacked platform suffixes are all stripped from <title>
+html7 = '<html><head><title>Binary Search Trees - Claude | Google Gemini</title></head><body><main><p>x</p></main></body></html>'
+t7 = _extract_chat_title(BeautifulSoup(html7, "html.parser"))
+print(f"Test 7 (stacked suffixes):      {t7!r}")
+assert t7 == "Binary Search Trees", f"FAIL: {t7}"
+
+# Test 8: role=complementary is checked before an earlier role=navigation bar
+html8 = (
+    '<html><head><title>Gemini</title></head><body>'
+    '<div role="navigation"><a class="active">Settings Panel Item</a></div>'
+    '<div role="complementary">'
+    '  <a>Some Chat</a>'
+    '  <a class="selected">Real Chat Name</a>'
+    '</div>'
+    '<main><p>Content</p></main>'
+    '</body></html>'
+)
+t8 = _extract_chat_title(BeautifulSoup(html8, "html.parser"))
+print(f"Test 8 (complementary first):   {t8!r}")
+assert t8 == "Real Chat Name", f"FAIL: {t8}"
+
 print("\nALL TESTS PASSED")
@@ -0,0 +1,44 @@
+"""Test title_generator._post — pooled keep-alive connection recovery."""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from title_generator import _post
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        out = b"ok:" + body
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        if body == b"slow":  # headers arrive, the body stalls past the timeout
+            time.sleep(1.5)
+        self.wfile.write(out)
+
+    def log_message(self, *args):
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = f"http://127.0.0.1:{server.server_port}/v1"
+
+# Test 1: a call that times out reading the body doesn't poison the next one
+_post(url, b"warm", {}, timeout=0.5)  # leave a reused connection in the pool
+try:
+    _post(url, b"slow", {}, timeout=0.5)
+except TimeoutError:
+    timed_out = True
+else:
+    timed_out = False
+assert timed_out, "FAIL: slow response did not time out"
+data = _post(url, b"next", {}, timeout=0.5)
+print(f"Test 1 (call after a timeout):  {data!r}")
+assert data == b"ok:next", f"FAIL: got {data!r}"
+
+server.shutdown()
+print("\nALL TESTS PASSED")
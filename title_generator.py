@@ -9,12 +9,22 @@ Two strategies:
 
 from __future__ import annotations
 
+import functools
+import http.client
 import json
 import logging
 import re
+import threading
+import urllib.parse
 import urllib.request
 import urllib.error
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
+
+try:  # optional — faster parsing of API responses
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -37,25 +47,35 @@ _FILLER_ENDS = [
     " step by step", " briefly",
 ]
 
+# Longest first, so e.g. "i want you to " wins over "i want to "
+_FILLER_STARTS_SORTED = tuple(sorted(_FILLER_STARTS, key=len, reverse=True))
+_FILLER_ENDS_SORTED = tuple(sorted(_FILLER_ENDS, key=len, reverse=True))
+
 
 # ──────────────────────────────────────────────
 #  Heuristic Title Generator
 # ──────────────────────────────────────────────
 
+_SMALL_WORDS = frozenset({
+    "a", "an", "the", "and", "but", "or", "for", "nor", "on",
+    "at", "to", "by", "in", "of", "is", "it", "vs", "with",
+})
+
+
 def _title_case(text: str) -> str:
     """Smart title-case that keeps short words lowercase (except first)."""
-    small = {"a", "an", "the", "and", "but", "or", "for", "nor", "on",
-             "at", "to", "by", "in", "of", "is", "it", "vs", "with"}
     words = text.split()
     result = []
     for i, w in enumerate(words):
-        if i == 0 or w.lower() not in small:
+        lw = w.lower()
+        if i == 0 or lw not in _SMALL_WORDS:
             result.append(w.capitalize())
         else:
-            result.append(w.lower())
+            result.append(lw)
     return " ".join(result)
 
 
+@functools.lru_cache(maxsize=1024)
 def generate_title_heuristic(question: str, max_length: int = 60) -> str:
     """
     Generate a clean, concise title from a verbose question using heuristics.
@@ -75,19 +95,19 @@ def generate_title_heuristic(question: str, max_length: int = 60) -> str:
     """
     text = question.strip()
 
-    # Remove filler starts (greedy — apply all that match)
+    # Remove filler starts (greedy — apply all that match).
+    # ``lower`` is sliced in step with ``text`` rather than re-lowered.
     lower = text.lower()
-    for filler in sorted(_FILLER_STARTS, key=len, reverse=True):
+    for filler in _FILLER_STARTS_SORTED:
         if lower.startswith(filler):
             text = text[len(filler):]
-            lower = text.lower()
+            lower = lower[len(filler):]
 
     # Remove filler ends
-    lower = text.lower()
-    for filler in sorted(_FILLER_ENDS, key=len, reverse=True):
+    for filler in _FILLER_ENDS_SORTED:
         if lower.endswith(filler):
             text = text[: -len(filler)]
-            lower = text.lower()
+            lower = lower[: -len(filler)]
 
     # Strip trailing punctuation
     text = text.strip(" ?.!,;:")
@@ -103,6 +123,79 @@ def generate_title_heuristic(question: str, max_length: int = 60) -> str:
     return text if text else question[:max_length]
 
 
+# ──────────────────────────────────────────────
+#  HTTP Transport (keep-alive)
+# ──────────────────────────────────────────────
+
+# Persistent connections keyed by (scheme, host), one set per thread —
+# http.client connections are not thread-safe.  Reusing a connection
+# skips the TCP + TLS handshake for every title after the first.
+_connections = threading.local()
+
+
+def _connection(scheme: str, netloc: str, timeout: float) -> http.client.HTTPConnection:
+    """Return this thread's keep-alive connection to *netloc*."""
+    pool: dict = _connections.__dict__.setdefault("pool", {})
+    conn = pool.get((scheme, netloc))
+    if conn is None:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = pool[(scheme, netloc)] = cls(netloc, timeout=timeout)
+    return conn
+
+
+# Errors meaning a kept-alive socket was closed by the server before any
+# response arrived — the only case where resending the POST is safe.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+def _post(url: str, body: bytes, headers: dict[str, str], *, timeout: float = 10) -> bytes:
+    """
+    POST *body* to *url* and return the response body.
+
+    Goes over a reused keep-alive connection; proxied environments fall
+    back to ``urllib.request.urlopen`` so proxy settings keep working.
+
+    Raises:
+        urllib.error.HTTPError: On a non-2xx status (same as ``urlopen``).
+        OSError / http.client.HTTPException: On transport failures.
+    """
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https") or urllib.request.getproxies().get(parts.scheme):
+        req = urllib.request.Request(url, data=body, headers=headers, method="POST")
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.read()
+
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    conn = _connection(parts.scheme, parts.netloc, timeout)
+    reused = conn.sock is not None
+    try:
+        try:
+            conn.request("POST", path, body=body, headers=headers)
+            resp = conn.getresponse()
+        except _STALE_CONNECTION_ERRORS:
+            if not reused:
+                raise
+            # The server dropped the idle connection before answering —
+            # retry once on a fresh one.  Timeouts and other failures are
+            # not retried: the request may already have been processed.
+            conn.close()
+            conn.request("POST", path, body=body, headers=headers)
+            resp = conn.getresponse()
+        data = resp.read()
+    except BaseException:
+        # Never leave the pooled connection with a request in flight —
+        # the next call on this thread would fail with CannotSendRequest.
+        conn.close()
+        raise
+
+    if not 200 <= resp.status < 300:
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+    return data
+
+
 # ──────────────────────────────────────────────
 #  AI-Powered Title Generator (OpenAI-compatible)
 # ──────────────────────────────────────────────
@@ -113,6 +206,81 @@ _SYSTEM_PROMPT = (
     "Return ONLY the title text, no quotes, no punctuation at the end, no explanation."
 )
 
+_BATCH_SYSTEM_PROMPT = (
+    "You are a title generator. You will receive numbered questions or messages "
+    "from AI chats. For each one, generate a short, concise title (3-8 words) "
+    "suitable as a Markdown heading. Return exactly one numbered line per input, "
+    "in the same order (e.g. '1. Title'), with no quotes, no punctuation at the "
+    "end and no other text."
+)
+
+# What a failed or malformed API call can raise: transport errors
+# (URLError, HTTPError, timeouts and resets are all OSError),
+# http.client protocol errors, undecodable JSON (ValueError), and
+# replies missing the expected choices/message/content structure.
+_API_ERRORS = (
+    OSError, http.client.HTTPException, ValueError,
+    KeyError, IndexError, TypeError, AttributeError,
+)
+
+# Questions packed into one batched request
+_BATCH_SIZE = 20
+
+# Batched requests allowed in flight at once (stays under provider rate limits)
+_MAX_CONCURRENT_REQUESTS = 4
+
+# "1. Title" / "2) Title" line markers in a batched reply
+_NUMBERED_LINE_RE = re.compile(r"^\s*\d+[.)]\s*", re.MULTILINE)
+
+
+_BASE_HEADERS = {"Content-Type": "application/json"}
+
+
+@functools.lru_cache(maxsize=8)
+def _endpoint(api_base: str) -> str:
+    """Chat-completions URL for an API base."""
+    return f"{api_base.rstrip('/')}/chat/completions"
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialise a request body, using ``orjson`` when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(body: bytes) -> Any:
+    """Parse a JSON response body, using ``orjson`` when available."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body.decode("utf-8"))
+
+
+def _complete(
+    system_prompt: str,
+    user_content: str,
+    *,
+    api_key: str,
+    api_base: str,
+    model: str,
+    max_tokens: int,
+) -> str:
+    """Run one chat completion and return the reply text (raises on failure)."""
+    payload = _dumps({
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_content},
+        ],
+        "max_tokens": max_tokens,
+        "temperature": 0.3,
+    })
+    headers = {**_BASE_HEADERS, "Authorization": f"Bearer {api_key}"}
+
+    body = _post(_endpoint(api_base), payload, headers, timeout=10)  # fully read; connection free
+    data = _loads(body)
+    return data["choices"][0]["message"]["content"]
+
 
 def generate_title_ai(
     question: str,
@@ -133,34 +301,106 @@ def generate_title_ai(
     Returns:
         Generated title, or None if the API call fails.
     """
-    url = f"{api_base.rstrip('/')}/chat/completions"
-
-    payload = json.dumps({
-        "model": model,
-        "messages": [
-            {"role": "system", "content": _SYSTEM_PROMPT},
-            {"role": "user", "content": question},
-        ],
-        "max_tokens": 30,
-        "temperature": 0.3,
-    }).encode("utf-8")
-
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}",
-    }
+    try:
+        reply = _complete(
+            _SYSTEM_PROMPT, question,
+            api_key=api_key, api_base=api_base, model=model, max_tokens=30,
+        )
+        title = reply.strip().strip('"\'')
+        logger.info("AI generated title: '%s'", title)
+        return title
+    except _API_ERRORS as exc:
+        logger.warning("AI title generation failed (%s) — falling back to heuristic.", exc)
+        return None
 
-    req = urllib.request.Request(url, data=payload, headers=headers, method="POST")
 
+def _titles_for_chunk(
+    chunk: List[str],
+    *,
+    api_key: str,
+    api_base: str,
+    model: str,
+) -> List[Optional[str]]:
+    """One batched request for up to ``_BATCH_SIZE`` questions."""
+    if len(chunk) == 1:
+        return [generate_title_ai(chunk[0], api_key=api_key, api_base=api_base, model=model)]
+
+    # Numbering relies on one line per question
+    numbered = "\n".join(
+        f"{i}. {' '.join(q.split())}" for i, q in enumerate(chunk, 1)
+    )
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-            title = data["choices"][0]["message"]["content"].strip().strip('"\'')
-            logger.info("AI generated title: '%s'", title)
-            return title
-    except (urllib.error.URLError, urllib.error.HTTPError, KeyError, Exception) as exc:
+        reply = _complete(
+            _BATCH_SYSTEM_PROMPT, numbered,
+            api_key=api_key, api_base=api_base, model=model,
+            max_tokens=30 * len(chunk),
+        )
+        # Drop any preamble before "1.", then one title per numbered line
+        lines = [t.strip().strip('"\'') for t in _NUMBERED_LINE_RE.split(reply)[1:]]
+    except _API_ERRORS as exc:
         logger.warning("AI title generation failed (%s) — falling back to heuristic.", exc)
-        return None
+        return [None] * len(chunk)
+
+    if len(lines) != len(chunk) or not all(lines):
+        logger.warning(
+            "AI returned %d title(s) for %d question(s) — falling back to heuristic.",
+            len(lines), len(chunk),
+        )
+        return [None] * len(chunk)
+
+    logger.info("AI generated %d titles in one request", len(lines))
+    return lines
+
+
+def generate_titles_ai(
+    questions: List[str],
+    *,
+    api_key: str,
+    api_base: str = "https://api.openai.com/v1",
+    model: str = "gpt-4o-mini",
+) -> List[Optional[str]]:
+    """
+    Generate titles for many questions, packing up to ``_BATCH_SIZE``
+    of them into each API call instead of one round-trip per question.
+    When there are several batches, up to ``_MAX_CONCURRENT_REQUESTS``
+    of them are sent in parallel.
+
+    Args:
+        questions: Raw user questions, in order.
+        api_key: API key for authentication.
+        api_base: Base URL (supports OpenAI, Azure, local LLMs).
+        model: Model identifier.
+
+    Returns:
+        One entry per question — the generated title, or None where a
+        batch failed or its reply couldn't be matched up line-for-line.
+    """
+    chunks = [questions[i:i + _BATCH_SIZE] for i in range(0, len(questions), _BATCH_SIZE)]
+    fetch = functools.partial(_titles_for_chunk, api_key=api_key, api_base=api_base, model=model)
+
+    if len(chunks) < 2:
+        results = [fetch(chunk) for chunk in chunks]
+    else:
+        # Requests are I/O-bound; each worker thread keeps its own connection
+        with ThreadPoolExecutor(max_workers=min(len(chunks), _MAX_CONCURRENT_REQUESTS)) as pool:
+            results = list(pool.map(fetch, chunks))
+    return [title for batch in results for title in batch]
+
+
+# ──────────────────────────────────────────────
+#  Title Cache
+# ──────────────────────────────────────────────
+
+# Successful AI titles keyed by (question, api_base, model) — the same
+# question recurs on re-exports and regenerations.  Failures are not
+# cached, so a later call retries the API.
+_AI_TITLE_CACHE: dict[tuple[str, str, str], str] = {}
+
+
+def clear_title_cache() -> None:
+    """Forget memoised AI and heuristic titles."""
+    _AI_TITLE_CACHE.clear()
+    generate_title_heuristic.cache_clear()
 
 
 # ──────────────────────────────────────────────
@@ -174,6 +414,7 @@ def generate_smart_title(
     api_base: str = "https://api.openai.com/v1",
     model: str = "gpt-4o-mini",
     max_length: int = 60,
+    use_cache: bool = True,
 ) -> str:
     """
     Generate a clean title — uses AI if an API key is configured, 
@@ -185,15 +426,68 @@ def generate_smart_title(
         api_base: API base URL.
         model: Model name.
         max_length: Max title length for heuristic fallback.
+        use_cache: Reuse (and store) earlier AI titles for the same question.
 
     Returns:
         A concise, clean title string.
     """
     if api_key:
-        ai_title = generate_title_ai(
-            question, api_key=api_key, api_base=api_base, model=model
-        )
+        key = (question, api_base, model)
+        ai_title = _AI_TITLE_CACHE.get(key) if use_cache else None
+        if ai_title is None:
+            ai_title = generate_title_ai(
+                question, api_key=api_key, api_base=api_base, model=model
+            )
+            if ai_title and use_cache:
+                _AI_TITLE_CACHE[key] = ai_title
         if ai_title:
             return ai_title
 
     return generate_title_heuristic(question, max_length=max_length)
+
+
+def generate_smart_titles(
+    questions: List[str],
+    *,
+    api_key: Optional[str] = None,
+    api_base: str = "https://api.openai.com/v1",
+    model: str = "gpt-4o-mini",
+    max_length: int = 60,
+    use_cache: bool = True,
+) -> List[str]:
+    """
+    Batch form of :func:`generate_smart_title` — AI titles are requested
+    for all questions at once, heuristics fill any gaps.
+
+    Args:
+        questions: Raw user questions / phrases, in order.
+        api_key: Optional OpenAI API key. If None or empty, uses heuristic.
+        api_base: API base URL.
+        model: Model name.
+        max_length: Max title length for heuristic fallback.
+        use_cache: Reuse (and store) earlier AI titles for the same question.
+
+    Returns:
+        One concise, clean title per question, in the same order.
+    """
+    ai_titles: List[Optional[str]] = [None] * len(questions)
+    if api_key and questions:
+        keys = [(q, api_base, model) for q in questions]
+        if use_cache:
+            ai_titles = [_AI_TITLE_CACHE.get(key) for key in keys]
+        missing = [i for i, title in enumerate(ai_titles) if title is None]
+        if missing:
+            fresh = generate_titles_ai(
+                [questions[i] for i in missing],
+                api_key=api_key, api_base=api_base, model=model,
+            )
+            for i, title in zip(missing, fresh):
+                if title:
+                    ai_titles[i] = title
+                    if use_cache:
+                        _AI_TITLE_CACHE[keys[i]] = title
+
+    return [
+        ai_title or generate_title_heuristic(q, max_length=max_length)
+        for q, ai_title in zip(questions, ai_titles)
+    ]
@@ -15,20 +15,30 @@ interactively with a rich terminal UI.
 from __future__ import annotations
 
 import argparse
+import dataclasses
+import functools
 import logging
 import os
+import queue
 import re
+import signal
 import sys
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import ContextManager, Iterable, Optional
 
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
 
 from config_loader import AppConfig, load_config
-from converter import ExtractionResult, extract_response, extract_full_page, save_to_file
-from title_generator import generate_smart_title
+from converter import (
+    ExtractionResult, MergeWriter, extract_response, extract_full_page, save_to_file,
+)
+from title_generator import generate_smart_title, generate_smart_titles, generate_title_heuristic
 from logger import setup_logging
 
 logger = logging.getLogger(__name__)
@@ -50,61 +60,116 @@ class _Style:
 
     @staticmethod
     def ok(msg: str) -> str:
-        return f"{_Style.GREEN}✔ {msg}{_Style.RESET}"
+        return f"{_OK_PREFIX}{msg}{_Style.RESET}"
 
     @staticmethod
     def warn(msg: str) -> str:
-        return f"{_Style.YELLOW}⚠ {msg}{_Style.RESET}"
+        return f"{_WARN_PREFIX}{msg}{_Style.RESET}"
 
     @staticmethod
     def err(msg: str) -> str:
-        return f"{_Style.RED}✖ {msg}{_Style.RESET}"
+        return f"{_ERR_PREFIX}{msg}{_Style.RESET}"
 
     @staticmethod
     def info(msg: str) -> str:
-        return f"{_Style.CYAN}ℹ {msg}{_Style.RESET}"
+        return f"{_INFO_PREFIX}{msg}{_Style.RESET}"
 
     @staticmethod
     def header(msg: str) -> str:
-        width = 48
-        border = "═" * width
-        pad = (width - len(msg)) // 2
+        pad = (_HEADER_WIDTH - len(msg)) // 2
         return (
-            f"\n{_Style.MAGENTA}{_Style.BOLD}"
-            f"╔{border}╗\n"
-            f"║{' ' * pad}{msg}{' ' * (width - pad - len(msg))}║\n"
-            f"╚{border}╝"
-            f"{_Style.RESET}\n"
+            f"{_HEADER_TOP}"
+            f"║{' ' * pad}{msg}{' ' * (_HEADER_WIDTH - pad - len(msg))}║\n"
+            f"{_HEADER_BOTTOM}"
         )
 
     @staticmethod
     def divider() -> str:
-        return f"{_Style.DIM}{'─' * 50}{_Style.RESET}"
+        return _DIVIDER
+
+
+# Constant parts of the styled strings, built once
+_OK_PREFIX = f"{_Style.GREEN}✔ "
+_WARN_PREFIX = f"{_Style.YELLOW}⚠ "
+_ERR_PREFIX = f"{_Style.RED}✖ "
+_INFO_PREFIX = f"{_Style.CYAN}ℹ "
+_HEADER_WIDTH = 48
+_HEADER_TOP = f"\n{_Style.MAGENTA}{_Style.BOLD}╔{'═' * _HEADER_WIDTH}╗\n"
+_HEADER_BOTTOM = f"╚{'═' * _HEADER_WIDTH}╝{_Style.RESET}\n"
+_DIVIDER = f"{_Style.DIM}{'─' * 50}{_Style.RESET}"
+_PHRASE_PROMPT = f"{_Style.CYAN}  ▸ Search phrase (ENTER to finish): {_Style.RESET}"
+_TITLE_PREFIX = f"    {_Style.DIM}Title: "
+_LANGS_PREFIX = f"    {_Style.DIM}Languages detected: "
+_LISTENING = f"\n{_Style.DIM}Listening for new files…{_Style.RESET}"
+
+
+def _emit(lines: list[str]) -> None:
+    """
+    Write queued output *lines* in a single call, then empty the queue.
+
+    Interactive output is collected between prompts and written at once,
+    so a slow terminal (e.g. over SSH) gets one write instead of several.
+    """
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
 
 
 # ──────────────────────────────────────────────
 #  Processing Pipeline
 # ──────────────────────────────────────────────
 
+# Characters not allowed in Windows filenames
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
+
 def _sanitize_filename(name: str, max_len: int = 50) -> str:
     """Create a filesystem-safe filename from a phrase."""
-    safe = re.sub(r'[<>:"/\\|?*]', "", name)
+    safe = _UNSAFE_FILENAME_RE.sub("", name)
     safe = safe.replace(" ", "_").strip("_")
     return safe[:max_len] + ".md"
 
 
+def _merge_writer(
+    merge_target: Optional[str], config: AppConfig
+) -> ContextManager[Optional[MergeWriter]]:
+    """A :class:`MergeWriter` for *merge_target*, or a no-op context yielding None."""
+    return MergeWriter(merge_target, config=config) if merge_target else nullcontext()
+
+
 def _get_smart_title(phrase: str, config: AppConfig) -> str:
     """Generate a smart title using AI or heuristic fallback."""
     if not config.settings.smart_titles:
         return phrase
+    if not (config.ai.enabled and config.ai.api_key):  # heuristic only
+        return generate_title_heuristic(phrase, config.settings.max_filename_length)
 
-    api_key = config.ai.api_key if config.ai.enabled else None
     return generate_smart_title(
         phrase,
-        api_key=api_key,
+        api_key=config.ai.api_key,
+        api_base=config.ai.api_base,
+        model=config.ai.model,
+        max_length=config.settings.max_filename_length,
+        use_cache=config.settings.title_cache,
+    )
+
+
+def _get_smart_titles(phrases: list[str], config: AppConfig) -> list[str]:
+    """Batch form of :func:`_get_smart_title` — one AI request per batch."""
+    if not config.settings.smart_titles:
+        return list(phrases)
+    if not (config.ai.enabled and config.ai.api_key):  # heuristic only
+        max_length = config.settings.max_filename_length
+        return [generate_title_heuristic(p, max_length) for p in phrases]
+
+    return generate_smart_titles(
+        phrases,
+        api_key=config.ai.api_key,
         api_base=config.ai.api_base,
         model=config.ai.model,
         max_length=config.settings.max_filename_length,
+        use_cache=config.settings.title_cache,
     )
 
 
@@ -125,51 +190,75 @@ def process_file(
     Returns:
         Number of successful extractions.
     """
-    print(f"\n{_Style.info(f'Opened: {file_path.name}')}")
+    out = [f"\n{_Style.info(f'Opened: {file_path.name}')}"]
 
+    # Checked once up front so the user isn't prompted for phrases in vain;
+    # the per-phrase extraction then relies on its own read error handling
     if not file_path.exists():
-        print(_Style.err("File not found."))
+        out.append(_Style.err("File not found."))
+        _emit(out)
         return 0
 
     count = 0
-    while True:
-        print(_Style.divider())
-        phrase = input(f"{_Style.CYAN}  ▸ Search phrase (ENTER to finish): {_Style.RESET}")
-
-        if not phrase.strip():
-            print(_Style.ok(f"Done — {count} extraction(s) from this file."))
-            break
-
-        logger.debug("Searching for: '%s'", phrase)
-        result: ExtractionResult = extract_response(file_path, phrase, config=config)
-
-        if result.success and result.markdown:
-            title = _get_smart_title(phrase, config)
-            if title != phrase:
-                print(f"    {_Style.DIM}Title: {title}{_Style.RESET}")
-
-            if merge_target:
-                saved = save_to_file(
-                    result.markdown, merge_target, title, mode="a", config=config
-                )
-                print(_Style.ok(f"Appended to {merge_target}  ({result.word_count} words)"))
+    # One handle on the merge file for the whole session, not one per phrase
+    with _merge_writer(merge_target, config) as merger:
+        while True:
+            out.append(_Style.divider())
+            _emit(out)
+            phrase = input(_PHRASE_PROMPT)
+
+            if not phrase.strip():
+                print(_Style.ok(f"Done — {count} extraction(s) from this file."))
+                break
+
+            logger.debug("Searching for: '%s'", phrase)
+            result: ExtractionResult = extract_response(file_path, phrase, config=config)
+
+            if result.success and result.markdown:
+                title = _get_smart_title(phrase, config)
+                if title != phrase:
+                    out.append(f"{_TITLE_PREFIX}{title}{_Style.RESET}")
+
+                if merger is not None:
+                    saved = merger.write(result.markdown, title, tags=result.detected_languages)
+                    out.append(_Style.ok(
+                        f"Appended to {merge_target}  ({result.word_count} words)"
+                    ))
+                else:
+                    fname = _sanitize_filename(title, config.settings.max_filename_length)
+                    saved = save_to_file(
+                        result.markdown, fname, title, mode="w", config=config,
+                        tags=result.detected_languages,
+                    )
+                    out.append(_Style.ok(f"Saved → {fname}  ({result.word_count} words)"))
+
+                if result.detected_languages:
+                    langs = ", ".join(result.detected_languages)
+                    out.append(f"{_LANGS_PREFIX}{langs}{_Style.RESET}")
+                count += 1
             else:
-                fname = _sanitize_filename(title, config.settings.max_filename_length)
-                saved = save_to_file(
-                    result.markdown, fname, title, mode="w", config=config
-                )
-                print(_Style.ok(f"Saved → {fname}  ({result.word_count} words)"))
-
-            if result.detected_languages:
-                langs = ", ".join(result.detected_languages)
-                print(f"    {_Style.DIM}Languages detected: {langs}{_Style.RESET}")
-            count += 1
-        else:
-            print(_Style.warn(result.message))
+                out.append(_Style.warn(result.message))
 
     return count
 
 
+def _list_html(directory: Path) -> list[Path]:
+    """
+    Sorted ``.html`` / ``.htm`` files directly inside *directory*.
+
+    One ``os.scandir`` pass — the extension match ignores case (so
+    ``CHAT.HTML`` is found, ``notes.html.bak`` is not) and the file-type
+    check comes from the cached directory entry, so sub-directories named
+    ``*.html`` are skipped without an extra ``stat`` per entry.
+    """
+    with os.scandir(directory) as entries:
+        names = [
+            e.name for e in entries
+            if e.name.lower().endswith((".html", ".htm")) and e.is_file()
+        ]
+    return [directory / name for name in sorted(names)]
+
+
 def batch_process(
     directory: Path,
     *,
@@ -177,7 +266,7 @@ def batch_process(
     config: AppConfig,
 ) -> None:
     """Process every HTML/HTM file in a directory."""
-    html_files = sorted(directory.glob("*.htm*"))
+    html_files = _list_html(directory)
     if not html_files:
         print(_Style.warn(f"No HTML files found in {directory}"))
         return
@@ -208,41 +297,99 @@ def process_full_page(
     Returns:
         1 if successful, 0 otherwise.
     """
-    print(f"\n{_Style.info(f'Full-page export: {file_path.name}')}")
-
-    if not file_path.exists():
-        print(_Style.err("File not found."))
-        return 0
+    out = [f"\n{_Style.info(f'Full-page export: {file_path.name}')}"]
 
+    # No exists() pre-check: a missing file comes back as a failed result
     result: ExtractionResult = extract_full_page(file_path, config=config)
 
+    saved = 0
     if result.success and result.markdown:
-        # Prefer the conversation name extracted from HTML; fall back to filename
-        raw_title = result.title or file_path.stem.replace("_", " ").replace("-", " ")
-        title = _get_smart_title(raw_title, config)
+        title = _get_smart_title(_full_page_title(file_path, result), config)
+        with _merge_writer(merge_target, config) as merger:
+            saved = _save_full_page(
+                file_path, result, title, merger=merger, config=config, out=out
+            )
+    else:
+        out.append(_Style.warn(result.message))
+    _emit(out)
+    return saved
 
-        if title != raw_title:
-            print(f"    {_Style.DIM}Title: {title}{_Style.RESET}")
 
-        if merge_target:
-            saved = save_to_file(
-                result.markdown, merge_target, title, mode="a", config=config
-            )
-            print(_Style.ok(f"Appended to {merge_target}  ({result.word_count} words)"))
-        else:
-            fname = _sanitize_filename(title, config.settings.max_filename_length)
-            saved = save_to_file(
-                result.markdown, fname, title, mode="w", config=config
-            )
-            print(_Style.ok(f"Saved → {fname}  ({result.word_count} words)"))
+def _full_page_title(file_path: Path, result: ExtractionResult) -> str:
+    """Prefer the conversation name extracted from HTML; fall back to filename."""
+    return result.title or file_path.stem.replace("_", " ").replace("-", " ")
+
+
+def _save_full_page(
+    file_path: Path,
+    result: ExtractionResult,
+    title: str,
+    *,
+    merger: Optional[MergeWriter],
+    config: AppConfig,
+    out: list[str],
+) -> int:
+    """Save a successful full-page extraction under *title*; report lines go to *out*."""
+    if title != _full_page_title(file_path, result):
+        out.append(f"{_TITLE_PREFIX}{title}{_Style.RESET}")
 
-        if result.detected_languages:
-            langs = ", ".join(result.detected_languages)
-            print(f"    {_Style.DIM}Languages detected: {langs}{_Style.RESET}")
-        return 1
+    if merger is not None:
+        saved = merger.write(result.markdown, title, tags=result.detected_languages)
+        out.append(_Style.ok(f"Appended to {merger.filename}  ({result.word_count} words)"))
     else:
-        print(_Style.warn(result.message))
-        return 0
+        fname = _sanitize_filename(title, config.settings.max_filename_length)
+        saved = save_to_file(
+            result.markdown, fname, title, mode="w", config=config,
+            tags=result.detected_languages,
+        )
+        out.append(_Style.ok(f"Saved → {fname}  ({result.word_count} words)"))
+
+    if result.detected_languages:
+        langs = ", ".join(result.detected_languages)
+        out.append(f"{_LANGS_PREFIX}{langs}{_Style.RESET}")
+    return 1
+
+
+def _collect_with_progress(
+    results: Iterable[ExtractionResult], total: int
+) -> list[ExtractionResult]:
+    """
+    Drain *results* into a list, redrawing a ``[done/total]`` counter in
+    place on stderr (at most ~100 updates) when it is a terminal.
+    """
+    step = max(1, total // 100) if sys.stderr.isatty() else 0
+    collected: list[ExtractionResult] = []
+    for result in results:
+        collected.append(result)
+        done = len(collected)
+        if step and (done % step == 0 or done == total):
+            sys.stderr.write(f"\r  {_Style.DIM}Extracting [{done}/{total}]{_Style.RESET}")
+            sys.stderr.flush()
+    if step:
+        sys.stderr.write("\r\033[K")  # clear the counter line
+        sys.stderr.flush()
+    return collected
+
+
+def _extract_full_pages(files: list[Path], config: AppConfig) -> list[ExtractionResult]:
+    """
+    Run :func:`extract_full_page` on every file, in order.
+
+    Parsing and conversion are CPU-bound and independent per file, so
+    batches are spread over worker processes.  Only extraction runs
+    there; titling and saving stay in this process, which keeps merged
+    output in file order.
+    """
+    extract = functools.partial(extract_full_page, config=config)
+    workers = min(len(files), os.cpu_count() or 1)
+    if workers < 2:
+        return _collect_with_progress(map(extract, files), len(files))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _collect_with_progress(
+            pool.map(extract, files, chunksize=max(1, len(files) // (workers * 4))),
+            len(files),
+        )
 
 
 def batch_full_page(
@@ -252,37 +399,141 @@ def batch_full_page(
     config: AppConfig,
 ) -> None:
     """Full-page export every HTML/HTM file in a directory."""
-    html_files = sorted(directory.glob("*.htm*"))
+    html_files = _list_html(directory)
     if not html_files:
         print(_Style.warn(f"No HTML files found in {directory}"))
         return
 
     print(_Style.info(f"Full-page export: {len(html_files)} file(s) in {directory}"))
-    total = 0
-    for f in html_files:
-        total += process_full_page(f, merge_target=merge_target, config=config)
-    print(f"\n{_Style.ok(f'Batch complete — {total}/{len(html_files)} file(s) exported.')}")
+
+    # Extract everything first so all titles go to the AI in one batch
+    results = list(zip(html_files, _extract_full_pages(html_files, config)))
+    exported = [(f, r) for f, r in results if r.success and r.markdown]
+    titles = iter(_get_smart_titles([_full_page_title(f, r) for f, r in exported], config))
+
+    # Saving is quick next to extraction: queue the per-file report and
+    # write it once, followed by the summary
+    total = words = 0
+    out: list[str] = []
+    try:
+        with _merge_writer(merge_target, config) as merger:
+            for f, result in results:
+                out.append(f"\n{_Style.info(f'Full-page export: {f.name}')}")
+                if result.success and result.markdown:
+                    total += _save_full_page(
+                        f, result, next(titles), merger=merger, config=config, out=out
+                    )
+                    words += result.word_count
+                else:
+                    out.append(_Style.warn(result.message))
+        failed = len(html_files) - total
+        summary = f"Batch complete — {total}/{len(html_files)} file(s) exported."
+        out.append(f"\n{_Style.ok(summary)}")
+        skipped = f", {failed} file(s) skipped" if failed else ""
+        out.append(f"    {_Style.DIM}{words} words{skipped}{_Style.RESET}")
+    finally:
+        _emit(out)
 
 
 # ──────────────────────────────────────────────
 #  Live Watcher
 # ──────────────────────────────────────────────
 
-class _HTMLFileHandler(FileSystemEventHandler):
-    """React to new HTML files appearing in the watched directory."""
+# Events for the same path within this many seconds are duplicates
+# (browsers often emit create + modify + rename for one download)
+_DEDUPE_WINDOW = 2.0
+_DEDUPE_MAX_PATHS = 128
+
+# Paths waiting for the worker thread; beyond this, new events are dropped
+_EVENT_QUEUE_SIZE = 1024
+
+
+def _wait_until_written(path: Path, *, interval: float = 0.1, timeout: float = 30.0) -> bool:
+    """
+    Block until *path* stops growing (same non-zero size twice in a row).
+
+    Returns False if the file vanished meanwhile — e.g. a browser temp
+    file renamed to its final name, which arrives as its own event.
+    A file still changing after *timeout* seconds is processed anyway.
+    """
+    deadline = time.monotonic() + timeout
+    previous = -1
+    while time.monotonic() < deadline:
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return False
+        if size == previous and size > 0:
+            return True
+        previous = size
+        time.sleep(interval)
+    return True
+
+
+class _HTMLFileHandler(PatternMatchingEventHandler):
+    """
+    React to new HTML files appearing in the watched directory.
+
+    The observer thread only enqueues paths; :meth:`drain` processes them
+    on a separate worker thread, so a long interactive session on one file
+    never stalls event delivery (and overflows the OS event buffer).
+    """
 
     def __init__(self, merge_target: Optional[str], config: AppConfig) -> None:
-        super().__init__()
+        # watchdog filters by pattern before dispatch, so the rest of a busy
+        # Downloads folder (images, PDFs, partial downloads) never reaches us
+        super().__init__(
+            patterns=["*.html", "*.htm"],
+            ignore_patterns=["*.crdownload", "*.part", "*.tmp"],
+            ignore_directories=True,
+        )
         self.merge_target = merge_target
         self.config = config
+        self.queue: queue.Queue[Path] = queue.Queue(maxsize=_EVENT_QUEUE_SIZE)
+        # Worker-thread only, so no lock needed
+        self._recent: OrderedDict[str, float] = OrderedDict()  # path → last seen
 
     def on_created(self, event) -> None:  # type: ignore[override]
-        path = Path(event.src_path)
+        self._enqueue(Path(event.src_path))
+
+    def on_moved(self, event) -> None:  # type: ignore[override]
+        # Browsers download to a temp name, then rename to *.html.  A move
+        # passes the filter if either end matches, so check the destination.
+        path = Path(event.dest_path)
         if path.suffix.lower() in {".html", ".htm"}:
-            print(f"\n{_Style.info(f'Detected: {path.name}')}")
-            time.sleep(1)  # allow write to finish
-            process_file(path, merge_target=self.merge_target, config=self.config)
-            print(f"\n{_Style.DIM}Listening for new files…{_Style.RESET}")
+            self._enqueue(path)
+
+    def _enqueue(self, path: Path) -> None:
+        try:
+            self.queue.put_nowait(path)
+        except queue.Full:
+            logger.warning("Event queue full — ignoring %s", path.name)
+
+    def drain(self) -> None:
+        """Worker loop: handle queued paths one at a time, forever."""
+        while True:
+            self._handle(self.queue.get())
+
+    def _seen_recently(self, path: Path) -> bool:
+        """Record *path* and report whether it was seen inside the window."""
+        key = str(path)
+        now = time.monotonic()
+        last = self._recent.pop(key, None)
+        self._recent[key] = now
+        if len(self._recent) > _DEDUPE_MAX_PATHS:
+            self._recent.popitem(last=False)
+        return last is not None and now - last < _DEDUPE_WINDOW
+
+    def _handle(self, path: Path) -> None:
+        if self._seen_recently(path):
+            return
+        if not _wait_until_written(path):
+            return
+        print(f"\n{_Style.info(f'Detected: {path.name}')}")
+        process_file(path, merge_target=self.merge_target, config=self.config)
+        # Events queued while the user was busy with this file are stale
+        self._seen_recently(path)
+        print(_LISTENING)
 
 
 def start_watcher(
@@ -290,21 +541,41 @@ def start_watcher(
     *,
     merge_target: Optional[str] = None,
     config: AppConfig,
+    polling: bool = False,
 ) -> None:
-    """Start the watchdog observer on *watch_dir*."""
+    """
+    Start the watchdog observer on *watch_dir*.
+
+    Native observers (inotify, ReadDirectoryChangesW) never see changes
+    on network shares, so *polling* — or a UNC path — switches to a
+    directory-polling observer instead.
+    """
     handler = _HTMLFileHandler(merge_target, config)
-    observer = Observer()
+    if polling or str(watch_dir).startswith("\\\\"):
+        from watchdog.observers.polling import PollingObserver
+        observer = PollingObserver(timeout=2.0)
+    else:
+        observer = Observer()
     observer.schedule(handler, str(watch_dir), recursive=False)
+    # Daemon: it may be blocked in input() when the watcher shuts down
+    threading.Thread(target=handler.drain, name="html-worker", daemon=True).start()
 
     print(_Style.ok(f"Live watcher running on: {watch_dir}"))
     print(f"{_Style.DIM}Press Ctrl+C to stop.{_Style.RESET}\n")
 
+    # Park the main thread until Ctrl+C instead of waking every second.
+    # Windows can't interrupt a bare lock wait, so there the wait still
+    # times out periodically to let the SIGINT handler run.
+    stop = threading.Event()
+    previous_handler = signal.signal(signal.SIGINT, lambda *_: stop.set())
     observer.start()
     try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
+        wake_interval = 1.0 if os.name == "nt" else None
+        while not stop.wait(wake_interval):
+            pass
         print(f"\n{_Style.warn('Shutting down watcher…')}")
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
         observer.stop()
     observer.join()
 
@@ -313,7 +584,9 @@ def start_watcher(
 #  CLI Entry Point
 # ──────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def _build_parser() -> argparse.ArgumentParser:
+    """The CLI parser — built once and reused (parsing doesn't mutate it)."""
     parser = argparse.ArgumentParser(
         prog="ai-chat-exporter",
         description="Convert AI chat HTML exports into clean Markdown notes.",
@@ -357,6 +630,16 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Override the Downloads directory path.",
     )
+    parser.add_argument(
+        "--polling",
+        action="store_true",
+        help="Poll for new files in watch mode (for network/mounted folders).",
+    )
+    parser.add_argument(
+        "--no-title-cache",
+        action="store_true",
+        help="Regenerate every title instead of reusing earlier results.",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -432,7 +715,11 @@ def main() -> None:
     # Config
     config = load_config()
     if args.downloads:
-        config.downloads_path = args.downloads
+        config = dataclasses.replace(config, downloads_path=args.downloads)
+    if args.no_title_cache:
+        config = dataclasses.replace(
+            config, settings=dataclasses.replace(config.settings, title_cache=False)
+        )
 
     # Version
     if args.version:
@@ -454,7 +741,12 @@ def main() -> None:
     elif args.batch:
         batch_process(Path(args.batch), merge_target=merge_target, config=config)
     elif args.watch:
-        start_watcher(config.downloads_dir, merge_target=merge_target, config=config)
+        start_watcher(
+            config.downloads_dir,
+            merge_target=merge_target,
+            config=config,
+            polling=args.polling,
+        )
     else:
         interactive_menu(config)
 